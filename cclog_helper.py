@@ -3,60 +3,117 @@
 Helper script for cclog to handle performance-critical operations
 """
 
+import functools
+import hashlib
 import json
 import os
+import re
+import shutil
 import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime
-from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, field
 from typing import Optional
 
+try:
+    # orjson is much faster than the stdlib decoder and accepts bytes directly
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-@dataclass
+
+# Dataclass slots are only available on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SessionSummary:
     """Summary data for a session - used by both list and info views"""
 
     session_id: str
     file_path: Path
-    start_timestamp: datetime
+    start_ts: float  # Epoch seconds, see datetime_to_epoch
     first_user_message: str
     modification_time: float
     file_size: int
 
     # Optional fields - only populated when needed
-    last_timestamp: Optional[datetime] = None
+    start_offset: Optional[int] = None  # UTC offset in seconds, None if naive
+    last_ts: Optional[float] = None
+    last_offset: Optional[int] = None
     line_count: Optional[int] = None
     matched_summaries: Optional[list] = None
 
-    @property
-    def duration_seconds(self) -> int:
-        """Calculate duration if last_timestamp is available"""
-        if self.last_timestamp and self.start_timestamp:
-            return int((self.last_timestamp - self.start_timestamp).total_seconds())
-        return 0
+    # Display fields - computed once in __post_init__
+    duration_seconds: int = field(init=False, repr=False, compare=False)
+    formatted_time: str = field(init=False, repr=False, compare=False)
+    formatted_duration: str = field(init=False, repr=False, compare=False)
+    formatted_modified: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute display strings used by the list and info views"""
+        # Duration is only known if last_ts is available; truncate the
+        # exact difference rather than each end
+        if self.last_ts is not None:
+            self.duration_seconds = int(self.last_ts - self.start_ts)
+        else:
+            self.duration_seconds = 0
+        self.formatted_time = format_epoch(self.start_ts, self.start_offset)
+        self.formatted_duration = format_duration(self.duration_seconds)
+        self.formatted_modified = format_relative_time(self.modification_time)
 
     @property
-    def formatted_time(self) -> str:
-        """Format start time for display"""
-        return self.start_timestamp.strftime("%Y-%m-%d %H:%M:%S")
+    def start_timestamp(self) -> datetime:
+        """Start time as the datetime it was parsed from"""
+        return epoch_to_datetime(self.start_ts, self.start_offset)
 
     @property
-    def formatted_duration(self) -> str:
-        """Format duration for display"""
-        return format_duration(self.duration_seconds)
+    def last_timestamp(self) -> Optional[datetime]:
+        """Last message time as the datetime it was parsed from, if known"""
+        if self.last_ts is None:
+            return None
+        return epoch_to_datetime(self.last_ts, self.last_offset)
 
     @property
     def formatted_summary(self) -> str:
         """Format first user message for display"""
+        # Kept lazy since messages can be huge and the list truncates them
         return format_summary(self.first_user_message)
 
-    @property
-    def formatted_modified(self) -> str:
-        """Format modification time as relative time"""
-        return format_relative_time(self.modification_time)
 
+def datetime_to_epoch(dt: datetime) -> tuple:
+    """
+    Split a datetime into (epoch seconds, UTC offset in seconds)
+    Naive datetimes are counted as UTC with a None offset, so their wall
+    clock time survives regardless of the local timezone
+    """
+    offset = dt.utcoffset()
+    if offset is None:
+        return dt.replace(tzinfo=timezone.utc).timestamp(), None
+    return dt.timestamp(), int(offset.total_seconds())
+
+
+def epoch_to_datetime(epoch_seconds: float, offset: Optional[int]) -> datetime:
+    """Rebuild the datetime split by datetime_to_epoch"""
+    if offset is None:
+        return datetime.fromtimestamp(epoch_seconds, timezone.utc).replace(tzinfo=None)
+    tz = timezone.utc if offset == 0 else timezone(timedelta(seconds=offset))
+    return datetime.fromtimestamp(epoch_seconds, tz)
+
+
+def format_epoch(epoch_seconds: float, offset: Optional[int]) -> str:
+    """Format epoch seconds as the original wall clock date and time"""
+    return time.strftime(
+        "%Y-%m-%d %H:%M:%S", time.gmtime(epoch_seconds + (offset or 0))
+    )
 
+
+@functools.lru_cache(maxsize=4096)
 def format_duration(seconds):
     """Format duration in seconds to human readable format"""
     if seconds < 60:
@@ -100,13 +157,51 @@ def format_relative_time(modification_time: float) -> str:
         return f"{months}mo ago"
 
 
+# Cheap sniff for an ISO-8601 date and time prefix before trying a parser
+_ISO_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}")
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_timestamp(timestamp_str: Optional[str]) -> Optional[datetime]:
     """Parse ISO timestamp string to datetime"""
-    if not timestamp_str:
+    if not timestamp_str or type(timestamp_str) is not str:
         return None
+
+    # Fast path for the fixed YYYY-MM-DDTHH:MM:SS[.fff]Z layout Claude writes
+    ts = timestamp_str
+    if (
+        len(ts) >= 20
+        and ts[-1] == "Z"
+        and ts[10] == "T"
+        and ts[4] == ts[7] == "-"
+        and ts[13] == ts[16] == ":"
+        and (len(ts) == 20 or ts[19] == ".")
+    ):
+        try:
+            fraction = ts[20:-1]
+            return datetime(
+                int(ts[0:4]),
+                int(ts[5:7]),
+                int(ts[8:10]),
+                int(ts[11:13]),
+                int(ts[14:16]),
+                int(ts[17:19]),
+                int(fraction[:6].ljust(6, "0")) if fraction else 0,
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+
+    # Reject anything that cannot be ISO-8601 without raising in the parser
+    if not _ISO_TIMESTAMP_RE.match(timestamp_str):
+        return None
+
+    # Only a trailing Z designates UTC; fromisoformat before 3.11 rejects it
+    if timestamp_str.endswith("Z"):
+        timestamp_str = timestamp_str[:-1] + "+00:00"
     try:
-        return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-    except (ValueError, TypeError):
+        return datetime.fromisoformat(timestamp_str)
+    except ValueError:
         return None
 
 
@@ -114,12 +209,13 @@ def extract_user_message(data: dict) -> str:
     """Extract user message from JSON data"""
     if data.get("type") == "user":
         content = data.get("message", {}).get("content")
-        if isinstance(content, str):
+        content_type = type(content)
+        if content_type is str:
             return content
-        elif isinstance(content, list):
+        elif content_type is list:
             # Handle array of content objects
             for item in content:
-                if isinstance(item, dict) and item.get("type") == "text":
+                if type(item) is dict and item.get("type") == "text":
                     text = item.get("text", "")
                     if text:
                         return text
@@ -129,92 +225,223 @@ def extract_user_message(data: dict) -> str:
 def extract_timestamp(data: dict) -> Optional[datetime]:
     """Extract and parse timestamp from JSON data"""
     timestamp_str = data.get("timestamp")
-    if timestamp_str:
+    # Only strings are hashable keys for the parse_timestamp cache
+    if timestamp_str and isinstance(timestamp_str, str):
         return parse_timestamp(timestamp_str)
     return None
 
 
+# Byte patterns to pluck fields from raw JSONL lines without decoding them
+_USER_TYPE_RE = re.compile(rb'"type"\s*:\s*"user"')
+_ASSISTANT_TYPE_RE = re.compile(rb'"type"\s*:\s*"assistant"')
+_UUID_RE = re.compile(rb'"uuid"\s*:\s*"([^"]{1,256})"')
+_SUMMARY_TYPE_RE = re.compile(rb'"type"\s*:\s*"summary"')
+
+
+# Files up to this size are read in one call and split instead of iterated
+_BULK_READ_LIMIT = 8 * 1024 * 1024
+
+
+def iter_file_lines(f):
+    """Iterate lines of a binary file by splitting large raw reads"""
+    if os.fstat(f.fileno()).st_size <= _BULK_READ_LIMIT:
+        yield from f.read().split(b"\n")
+        return
+
+    # Bound memory for very large files by splitting 1 MiB blocks and
+    # carrying the trailing partial line over to the next block
+    remainder = b""
+    while chunk := f.read(1 << 20):
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()
+        yield from lines
+    yield remainder
+
+
+def decode_json_lines(lines) -> list:
+    """
+    Decode a batch of JSONL lines, skipping blank ones
+    Each line is decoded on its own, with None for malformed lines, so a
+    truncated line can never splice into its neighbour
+    """
+    docs = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            docs.append(json_loads(line))
+        except ValueError:
+            docs.append(None)
+    return docs
+
+
+def read_last_line(f) -> bytes:
+    """Read the last non-empty line of a binary file by seeking backwards from the end"""
+    f.seek(0, os.SEEK_END)
+    size = f.tell()
+    chunk_size = 4096
+
+    while True:
+        start = max(0, size - chunk_size)
+        f.seek(start)
+        lines = f.read(size - start).split(b"\n")
+        # The first piece may be a partial line unless we reached the file start
+        candidates = lines if start == 0 else lines[1:]
+        for line in reversed(candidates):
+            stripped_line = line.strip()
+            if stripped_line:
+                return stripped_line
+        if start == 0:
+            return b""
+        chunk_size *= 2
+
+
+def count_lines(f) -> int:
+    """Count lines of a binary file with a C-level newline scan"""
+    f.seek(0)
+    count = 0
+    # Read into one reusable buffer instead of allocating a bytes per chunk
+    buf = bytearray(1 << 20)
+    last_byte = None
+    while n := f.readinto(buf):
+        count += buf.count(b"\n", 0, n)
+        last_byte = buf[n - 1]
+    # A final line without trailing newline still counts as a line
+    if last_byte is not None and last_byte != ord("\n"):
+        count += 1
+    return count
+
+
+def scan_session_header(f, summary_index: Optional[dict] = None):
+    """
+    Forward-scan an open binary session file
+    Returns (start_timestamp, first_user_message, matched_summaries)
+    """
+    start_timestamp = None
+    first_user_msg = ""
+    matched_summaries = []
+    assistant_uuids_checked = set()  # Track checked UUIDs to avoid duplicates
+
+    # Matching summaries requires a full scan, so read the file in bulk then;
+    # otherwise iterate lazily since the scan usually stops within a few lines
+    lines = iter_file_lines(f) if summary_index else f
+
+    for line_num, line in enumerate(lines, 1):
+        # Matching summaries needs every assistant line, otherwise
+        # the header fields are all we need from the forward scan
+        if not summary_index and start_timestamp and (first_user_msg or line_num > 20):
+            break
+
+        stripped_line = line.strip()
+        if not stripped_line:
+            continue
+
+        # Only decode lines that can provide the start timestamp, the user
+        # message or an assistant UUID present in the index. The timestamp
+        # must be the top-level key (snapshot lines nest their own), so it
+        # is read from the decoded line, which is usually the first one.
+        needs_timestamp = not start_timestamp and b'"timestamp"' in stripped_line
+        needs_user_msg = (
+            line_num <= 20
+            and not first_user_msg
+            and _USER_TYPE_RE.search(stripped_line)
+        )
+        needs_uuid = (
+            summary_index
+            and b'"uuid"' in stripped_line
+            and _ASSISTANT_TYPE_RE.search(stripped_line)
+            and any(
+                uuid.decode("utf-8", "replace") in summary_index
+                for uuid in _UUID_RE.findall(stripped_line)
+            )
+        )
+        if not (needs_timestamp or needs_user_msg or needs_uuid):
+            continue
+
+        # Try to parse JSON from this line
+        try:
+            data = json_loads(stripped_line)
+        except ValueError:
+            # Skip lines that aren't valid JSON
+            continue
+
+        # Look for first timestamp
+        if not start_timestamp:
+            ts = extract_timestamp(data)
+            if ts:
+                start_timestamp = ts
+
+        # Look for first user message (within first 20 lines)
+        if line_num <= 20 and not first_user_msg:
+            msg = extract_user_message(data)
+            if msg:
+                first_user_msg = msg
+
+        # Check for assistant message UUIDs in summary index
+        if summary_index and data.get("type") == "assistant":
+            msg_uuid = data.get("uuid")
+            if msg_uuid and msg_uuid not in assistant_uuids_checked:
+                assistant_uuids_checked.add(msg_uuid)
+                if msg_uuid in summary_index:
+                    matched_summaries.append(summary_index[msg_uuid])
+
+    return start_timestamp, first_user_msg, matched_summaries
+
+
 def parse_session_minimal(
-    file_path: Path, summary_index: Optional[dict] = None
+    file_path: Path,
+    summary_index: Optional[dict] = None,
+    stat: Optional[os.stat_result] = None,
+    with_line_count: bool = True,
 ) -> Optional[SessionSummary]:
     """
     Parse session file efficiently
     - Find first line with timestamp
     - Parse first 20 lines to find user message
-    - Count all lines
-    - Keep last line to parse for timestamp
+    - Only decode JSON for the start timestamp, user messages and
+      assistant UUIDs found in the summary index
+    - Stop the forward scan early unless assistant UUIDs must be matched
+    - Count lines with a byte scan, unless with_line_count is False
+    - Read last line backwards from the end to parse its timestamp
     """
     try:
-        stat = file_path.stat()
+        if stat is None:
+            stat = file_path.stat()
         session_id = file_path.stem
 
-        start_timestamp = None
-        first_user_msg = ""
-        last_line = None
-        line_count = 0
-        matched_summaries = []
-        assistant_uuids_checked = set()  # Track checked UUIDs to avoid duplicates
-
-        with open(file_path, "r") as f:
-            for line_num, line in enumerate(f, 1):
-                line_count = line_num
-                stripped_line = line.strip()
-                if not stripped_line:
-                    continue
-
-                # Keep track of last non-empty line
-                last_line = stripped_line
-
-                # Try to parse JSON from this line
-                try:
-                    data = json.loads(stripped_line)
-
-                    # Look for first timestamp
-                    if not start_timestamp:
-                        ts = extract_timestamp(data)
-                        if ts:
-                            start_timestamp = ts
-
-                    # Look for first user message (within first 20 lines)
-                    if line_num <= 20 and not first_user_msg:
-                        msg = extract_user_message(data)
-                        if msg:
-                            first_user_msg = msg
-
-                    # Check for assistant message UUIDs in summary index
-                    if summary_index and data.get("type") == "assistant":
-                        msg_uuid = data.get("uuid")
-                        if msg_uuid and msg_uuid not in assistant_uuids_checked:
-                            assistant_uuids_checked.add(msg_uuid)
-                            if msg_uuid in summary_index:
-                                matched_summaries.append(summary_index[msg_uuid])
-
-                except json.JSONDecodeError:
-                    # Skip lines that aren't valid JSON
-                    continue
+        with open(file_path, "rb") as f:
+            start_timestamp, first_user_msg, matched_summaries = scan_session_header(
+                f, summary_index
+            )
+            if not start_timestamp:
+                return None
 
-        if not start_timestamp:
-            return None
+            line_count = count_lines(f) if with_line_count else None
+            last_line = read_last_line(f)
 
         # Parse last line for timestamp
         last_timestamp = start_timestamp  # Default to start if can't parse last
         if last_line:
             try:
-                data = json.loads(last_line)
+                data = json_loads(last_line)
                 ts = extract_timestamp(data)
                 if ts:
                     last_timestamp = ts
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
 
+        start_ts, start_offset = datetime_to_epoch(start_timestamp)
+        last_ts, last_offset = datetime_to_epoch(last_timestamp)
         return SessionSummary(
             session_id=session_id,
             file_path=file_path,
-            start_timestamp=start_timestamp,
+            start_ts=start_ts,
+            start_offset=start_offset,
             first_user_message=first_user_msg or "no user message",
             modification_time=stat.st_mtime,
             file_size=stat.st_size,
-            last_timestamp=last_timestamp,
+            last_ts=last_ts,
+            last_offset=last_offset,
             line_count=line_count,
             matched_summaries=matched_summaries if matched_summaries else None,
         )
@@ -222,85 +449,387 @@ def parse_session_minimal(
         return None
 
 
+# Translation table escaping newlines as literal \n and \r in a single pass
+_NEWLINE_ESCAPES = str.maketrans({"\n": "\\n", "\r": "\\r"})
+
+
 def format_summary(first_user_msg):
     """Format the first user message for display"""
     if not first_user_msg:
         return "no user message"
 
     # Replace newlines with \n string
-    return first_user_msg.replace("\n", "\\n").replace("\r", "\\r")
+    return first_user_msg.translate(_NEWLINE_ESCAPES)
 
 
-def build_summary_index(project_dir):
-    """Build an index of leafUuid -> summary mappings from all summary files"""
-    summary_index = {}
+def format_summary_truncated(message, width):
+    """Format a message for display, truncated to at most width characters"""
+    # Escaping at most doubles the length, so anything past 2 * width
+    # characters would be cut anyway - drop it before escaping
+    formatted = format_summary(message[: width * 2])
+    if len(formatted) > width:
+        formatted = formatted[: width - 3] + "..."
+    return formatted
+
 
+def list_jsonl_files(project_dir):
+    """List (path, stat) of all *.jsonl files in a directory"""
+    # os.scandir avoids the extra stat calls issued by Path.glob
+    files = []
     try:
-        for file_path in Path(project_dir).glob("*.jsonl"):
-            # Quick check if it might be a summary file (small size)
-            try:
-                stat = file_path.stat()
-                # Skip large files (likely conversation files)
-                if stat.st_size > 10000:  # 10KB threshold
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".jsonl"):
                     continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((Path(entry.path), stat))
+    except OSError:
+        pass
+    return files
 
-                # Check if file contains summaries
-                with open(file_path, "r") as f:
-                    for line in f:
-                        try:
-                            data = json.loads(line.strip())
-                            if data.get("type") == "summary":
-                                leaf_uuid = data.get("leafUuid")
-                                summary_text = data.get("summary", "")
-                                if leaf_uuid and summary_text:
-                                    summary_index[leaf_uuid] = summary_text
-                        except json.JSONDecodeError:
-                            continue
-            except (OSError, IOError):
-                continue
 
-    except Exception:
-        # If indexing fails, return empty index
+def list_summary_candidates(jsonl_files):
+    """Filter (path, stat) pairs down to files small enough to be summary files"""
+    # Skip large files (likely conversation files)
+    return [
+        (file_path, stat)
+        for file_path, stat in jsonl_files
+        if stat.st_size <= 10000  # 10KB threshold
+    ]
+
+
+def scan_summary_file(file_path):
+    """Collect leafUuid -> summary mappings from a single file"""
+    summaries = {}
+    try:
+        # Check if file contains summaries
+        with open(file_path, "rb") as f:
+            for line in iter_file_lines(f):
+                # Only summary lines are decoded
+                if not _SUMMARY_TYPE_RE.search(line):
+                    continue
+                try:
+                    data = json_loads(line)
+                    if data.get("type") == "summary":
+                        leaf_uuid = data.get("leafUuid")
+                        summary_text = data.get("summary", "")
+                        if leaf_uuid and summary_text:
+                            summaries[leaf_uuid] = summary_text
+                except ValueError:
+                    continue
+    except (OSError, IOError):
         pass
+    return summaries
+
+
+# Below this many candidates a worker pool costs more than it saves
+_PARALLEL_SUMMARY_SCAN_MIN = 8
+
+
+def scan_summary_files(candidates):
+    """Build an index of leafUuid -> summary mappings from candidate files"""
+    summary_index = {}
+    paths = [file_path for file_path, _ in candidates]
+
+    # Each worker returns its own dict; merging in candidate order keeps
+    # the same precedence as a serial scan
+    if len(paths) < _PARALLEL_SUMMARY_SCAN_MIN:
+        for summaries in map(scan_summary_file, paths):
+            summary_index.update(summaries)
+        return summary_index
+
+    max_workers = min(32, os.cpu_count() or 1, len(paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for summaries in executor.map(scan_summary_file, paths):
+            summary_index.update(summaries)
 
     return summary_index
 
 
-def get_terminal_width():
-    """Get terminal width, with fallback to 80"""
-    # Check COLUMNS environment variable first (for testing and some terminals)
-    columns_env = os.environ.get("COLUMNS")
-    if columns_env:
+def build_summary_index(project_dir, jsonl_files=None):
+    """Build an index of leafUuid -> summary mappings from all summary files"""
+    try:
+        if jsonl_files is None:
+            jsonl_files = list_jsonl_files(project_dir)
+        if not jsonl_files:
+            # Nothing to index; don't cache anything for a missing project
+            return {}
+        candidates = list_summary_candidates(jsonl_files)
+
+        # The index only depends on the candidate files, so their stat data
+        # identifies it without opening any of them
+        digest = hashlib.sha1()
+        for file_path, stat in sorted(candidates, key=lambda c: c[0].name):
+            digest.update(
+                f"{file_path.name}\t{stat.st_mtime_ns}\t{stat.st_size}\n".encode()
+            )
+        token = digest.hexdigest()
+
+        cache_path = get_summary_index_cache_path(project_dir)
+        entry = read_json_cache(cache_path)
+        if entry.get("token") == token and isinstance(entry.get("index"), dict):
+            return entry["index"]
+
+        summary_index = scan_summary_files(candidates)
+        write_json_cache(cache_path, {"token": token, "index": summary_index})
+        return summary_index
+    except Exception:
+        # If indexing fails, return empty index
+        return {}
+
+
+# Session summary caches, one per project directory, loaded lazily
+_session_caches = {}
+# Project directory -> names of the sessions changed or dropped in this process
+_dirty_session_caches = {}
+
+
+def get_cache_dir() -> Path:
+    """Get the on-disk cache directory"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "cclog"
+
+
+def get_project_cache_name(project_dir) -> str:
+    """Get the file name under which a project directory's caches are kept"""
+    digest = hashlib.sha1(os.path.abspath(project_dir).encode()).hexdigest()
+    return f"{digest[:16]}.json"
+
+
+def get_session_cache_path(project_dir) -> Path:
+    """Get the on-disk session cache location for a project directory"""
+    return get_cache_dir() / "sessions" / get_project_cache_name(project_dir)
+
+
+def get_summary_index_cache_path(project_dir) -> Path:
+    """Get the on-disk summary index cache location for a project directory"""
+    return get_cache_dir() / "summaries" / get_project_cache_name(project_dir)
+
+
+def read_json_cache(cache_path: Path) -> dict:
+    """Read a JSON cache file, returning an empty dict if it is unusable"""
+    try:
+        with open(cache_path, "rb") as f:
+            data = json_loads(f.read())
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json_cache(cache_path: Path, data: dict) -> bool:
+    """Write a JSON cache file atomically, returning whether it succeeded"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
         try:
-            return int(columns_env)  # Use exact value from environment
-        except ValueError:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return True
+    except OSError:
+        # Caching is best effort
+        return False
+
+
+def load_session_cache(project_dir) -> dict:
+    """Load a project's session cache from disk, once per process"""
+    key = os.path.abspath(project_dir)
+    cache = _session_caches.get(key)
+    if cache is None:
+        cache = _session_caches[key] = read_json_cache(get_session_cache_path(key))
+    return cache
+
+
+def mark_session_dirty(project_key: str, name: str):
+    """Record that a cached session changed and must be written back"""
+    _dirty_session_caches.setdefault(project_key, set()).add(name)
+
+
+def save_session_cache():
+    """
+    Write changed sessions back to their project caches atomically
+    Only the sessions this process changed are merged into what is on disk,
+    so concurrent list and preview runs keep each other's entries
+    """
+    for key, names in list(_dirty_session_caches.items()):
+        cache_path = get_session_cache_path(key)
+        cache = _session_caches[key]
+        merged = read_json_cache(cache_path)
+        for name in names:
+            if name in cache:
+                merged[name] = cache[name]
+            else:
+                merged.pop(name, None)
+        if write_json_cache(cache_path, merged):
+            del _dirty_session_caches[key]
+
+
+def prune_session_cache(project_dir, jsonl_files):
+    """Drop cached sessions whose files are no longer in the project"""
+    cache = load_session_cache(project_dir)
+    names = {file_path.name for file_path, _ in jsonl_files}
+    project_key = os.path.abspath(project_dir)
+    for name in [name for name in cache if name not in names]:
+        del cache[name]
+        mark_session_dirty(project_key, name)
+
+
+def summary_index_token(summary_index: Optional[dict]) -> str:
+    """Fingerprint a summary index so cached topic matches can be validated"""
+    if not summary_index:
+        return ""
+    digest = hashlib.sha1()
+    for leaf_uuid in sorted(summary_index):
+        digest.update(f"{leaf_uuid}\t{summary_index[leaf_uuid]}\n".encode())
+    return digest.hexdigest()
+
+
+# format_summary_truncated only looks at the first 2 * width characters, so
+# this keeps list rows intact for message columns up to 512 wide
+_CACHED_MESSAGE_CHARS = 1024
+
+
+def summary_to_cache_entry(
+    summary: SessionSummary, stat: os.stat_result, token: str
+) -> dict:
+    """Serialize a SessionSummary with its validity token"""
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "summary_token": token,
+        "session_id": summary.session_id,
+        "start_ts": summary.start_ts,
+        "start_offset": summary.start_offset,
+        # Only the start of the message is ever displayed
+        "first_user_message": summary.first_user_message[:_CACHED_MESSAGE_CHARS],
+        "last_ts": summary.last_ts,
+        "last_offset": summary.last_offset,
+        "line_count": summary.line_count,
+        "matched_summaries": summary.matched_summaries,
+    }
+
+
+def summary_from_cache_entry(
+    entry: dict, file_path: Path, stat: os.stat_result
+) -> SessionSummary:
+    """Rebuild a SessionSummary from a cache entry"""
+    return SessionSummary(
+        session_id=entry["session_id"],
+        file_path=file_path,
+        start_ts=entry["start_ts"],
+        start_offset=entry["start_offset"],
+        first_user_message=entry["first_user_message"],
+        modification_time=stat.st_mtime,
+        file_size=stat.st_size,
+        last_ts=entry["last_ts"],
+        last_offset=entry["last_offset"],
+        line_count=entry["line_count"],
+        matched_summaries=entry["matched_summaries"],
+    )
+
+
+def refresh_cache_entry(
+    entry: dict, file_path: Path, token: str, with_line_count: bool
+) -> Optional[bool]:
+    """
+    Bring a cache entry for an unchanged file up to date without reparsing
+    Returns whether the entry changed, or None if the file must be reparsed
+    """
+    # Topic matches depend on the summary index, so a changed index means
+    # rescanning the session
+    if entry.get("summary_token") != token:
+        return None
+
+    # The list view skips line counting; count only what the preview needs
+    if with_line_count and entry.get("line_count") is None:
+        with open(file_path, "rb") as f:
+            entry["line_count"] = count_lines(f)
+        return True
+    return False
+
+
+def get_cached_session(
+    file_path: Path,
+    stat: os.stat_result,
+    summary_index: Optional[dict] = None,
+    token: Optional[str] = None,
+    with_line_count: bool = True,
+) -> Optional[SessionSummary]:
+    """Get a session summary from the cache, parsing the file only if it changed"""
+    file_path = Path(file_path)
+    project_key = os.path.abspath(file_path.parent)
+    cache = load_session_cache(project_key)
+    if token is None:
+        token = summary_index_token(summary_index)
+
+    key = file_path.name
+    entry = cache.get(key)
+    if (
+        isinstance(entry, dict)
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+        and entry.get("size") == stat.st_size
+    ):
+        try:
+            changed = refresh_cache_entry(entry, file_path, token, with_line_count)
+            if changed is not None:
+                summary = summary_from_cache_entry(entry, file_path, stat)
+                if changed:
+                    mark_session_dirty(project_key, key)
+                return summary
+        except (OSError, KeyError, TypeError, ValueError):
             pass
 
-    try:
-        # Try to get terminal size
-        columns = os.get_terminal_size().columns
-        return columns
-    except (OSError, AttributeError):
-        # Fallback if not in a terminal
-        return 80
+    summary = parse_session_minimal(file_path, summary_index, stat, with_line_count)
+    if summary:
+        cache[key] = summary_to_cache_entry(summary, stat, token)
+        mark_session_dirty(project_key, key)
+    elif key in cache:
+        del cache[key]
+        mark_session_dirty(project_key, key)
+    return summary
+
+
+@functools.lru_cache(maxsize=None)
+def get_terminal_width():
+    """Get terminal width, with fallback to 80 - computed once per process"""
+    # Honors COLUMNS first (for testing and some terminals), then asks the
+    # terminal, then falls back when stdout is not a terminal
+    return shutil.get_terminal_size((80, 24)).columns
+
+
+# Row layout for the session list, bound once so the format spec is parsed
+# by str.format in C rather than rebuilt per row.
+# CREATED(19) MODIFIED(8) DURATION(8) MESSAGES(8)  FIRST_MESSAGE \x1f SESSION_ID
+_format_session_row = "{:<19} {:>8} {:>8} {:>8}  {}\x1f{}\n".format
 
 
 def get_session_list(project_dir):
     """Generate list of sessions for fzf - streaming output for fast first results"""
-    # Build summary index first
-    summary_index = build_summary_index(project_dir)
-
     # Get all session files with their modification times (fast)
-    files_with_mtime = []
-    for file_path in Path(project_dir).glob("*.jsonl"):
-        try:
-            stat = file_path.stat()
-            files_with_mtime.append((file_path, stat.st_mtime))
-        except OSError:
-            continue
+    jsonl_files = list_jsonl_files(project_dir)
+
+    # Forget cached sessions whose files were deleted or moved; this also
+    # loads the project's cache before the workers share it
+    prune_session_cache(project_dir, jsonl_files)
+
+    # Build summary index first, reusing the same directory listing
+    summary_index = build_summary_index(project_dir, jsonl_files)
 
-    # Sort by modification time (newest first)
-    files_with_mtime.sort(key=lambda x: x[1], reverse=True)
+    files_with_mtime = [
+        (-stat.st_mtime, file_path, stat) for file_path, stat in jsonl_files
+    ]
+
+    # Sort by negated modification time (newest first) with a C-level key
+    files_with_mtime.sort(key=itemgetter(0))
+    summary_token = summary_index_token(summary_index)
 
     # Print all headers (will be made non-searchable by --header-lines=4)
     print(f"Claude Code Sessions for: {Path.cwd()}")
@@ -320,35 +849,92 @@ def get_session_list(project_dir):
         terminal_width - fixed_width - 2, 20
     )  # -2 for small margin
 
-    # Parse and print each file one by one (streaming output)
-    for file_path, _ in files_with_mtime:
-        summary = parse_session_minimal(file_path, summary_index)
-        if summary:
+    # Parse files on a worker pool but print them in modification-time order
+    # as soon as each leading result is ready (streaming output).
+    # Unchanged files are served from the session cache without parsing.
+    # Lines are not counted for the list; the MESSAGES column shows "-"
+    # until the exact count was cached by the info view.
+    # Rows are batched and only flushed when the next result is not ready
+    # yet or the batch grows large, so cached sessions go out in big writes.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    out = []
+    out_size = 0
+    try:
+        futures = [
+            executor.submit(
+                get_cached_session,
+                file_path,
+                stat,
+                summary_index,
+                summary_token,
+                False,
+            )
+            for _, file_path, stat in files_with_mtime
+        ]
+        for future in futures:
+            if out and not future.done():
+                sys.stdout.write("".join(out))
+                sys.stdout.flush()
+                out.clear()
+                out_size = 0
+            summary = future.result()
+            if not summary:
+                continue
+
             # Use matched summary if available, otherwise use first user message
             if summary.matched_summaries:
                 # Use first matched summary with a prefix
                 display_msg = "📑 " + summary.matched_summaries[0]
             else:
-                display_msg = summary.formatted_summary
+                display_msg = summary.first_user_message
 
             # Truncate message to fit terminal width
-            formatted_msg = format_summary(display_msg)
-            if len(formatted_msg) > available_for_message:
-                formatted_msg = formatted_msg[: available_for_message - 3] + "..."
+            formatted_msg = format_summary_truncated(display_msg, available_for_message)
 
             # Use Unit Separator (0x1F) as delimiter - non-printable ASCII character
-            print(
-                f"{summary.formatted_time:<19} {summary.formatted_modified:>8} {summary.formatted_duration:>8} {summary.line_count:>8}  {formatted_msg}\x1f{summary.session_id}"
+            row = _format_session_row(
+                summary.formatted_time,
+                summary.formatted_modified,
+                summary.formatted_duration,
+                "-" if summary.line_count is None else summary.line_count,
+                formatted_msg,
+                summary.session_id,
             )
+            out.append(row)
+            out_size += len(row)
+            if out_size >= 65536:
+                sys.stdout.write("".join(out))
+                sys.stdout.flush()
+                out.clear()
+                out_size = 0
+        if out:
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
+    finally:
+        # Stop parsing the tail if the reader went away early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    save_session_cache()
+
+
+def get_session_info(file_path, summary_index=None):
+    """Get detailed info about a session for preview
+
+    Callers that already hold the project's summary index can pass it in
+    to skip rebuilding it.
+    """
+    file_path = Path(file_path)
+    if summary_index is None:
+        # Build summary index for the project directory
+        summary_index = build_summary_index(file_path.parent)
 
-
-def get_session_info(file_path):
-    """Get detailed info about a session for preview"""
-    # Build summary index for the project directory
-    project_dir = Path(file_path).parent
-    summary_index = build_summary_index(project_dir)
-
-    summary = parse_session_minimal(Path(file_path), summary_index)
+    # Resolve from the session cache that the list view already filled
+    try:
+        summary = get_cached_session(file_path, file_path.stat(), summary_index)
+    except OSError:
+        summary = None
+    save_session_cache()
     if not summary:
         print(f"Error: Could not read file {file_path}")
         return
@@ -356,10 +942,8 @@ def get_session_info(file_path):
     print(f"{'Session:':<10} {summary.session_id}")
     print(f"{'Messages:':<10} {summary.line_count}")
     print(f"{'Started:':<10} {summary.formatted_time}")
-    if summary.last_timestamp and summary.last_timestamp != summary.start_timestamp:
-        print(
-            f"{'Finished:':<10} {summary.last_timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
-        )
+    if summary.last_ts is not None and summary.last_ts != summary.start_ts:
+        print(f"{'Finished:':<10} {format_epoch(summary.last_ts, summary.last_offset)}")
     if summary.duration_seconds > 0:
         print(f"{'Duration:':<10} {summary.formatted_duration}")
 
@@ -371,30 +955,28 @@ def get_session_info(file_path):
 
 
 def format_message_line(data):
-    """Format a single message line for display"""
-    msg_type = data.get("type", "")
-    if msg_type not in ["user", "assistant"]:
+    """Format a single message line for display as UTF-8 bytes"""
+    msg_type = data.get("type")
+    if msg_type not in ("user", "assistant"):
         return None
 
     # Extract timestamp
     timestamp = data.get("timestamp", "")
-    time_str = format_timestamp_as_time(timestamp)
+    time_str = format_timestamp_as_time(timestamp if isinstance(timestamp, str) else "")
 
     # Extract message content
-    content = data.get("message", {}).get("content", "")
+    message = data.get("message")
+    content = message.get("content", "") if isinstance(message, dict) else ""
     is_tool, message_text = parse_message_content(msg_type, content)
 
-    # Choose color based on message type
-    color = get_message_color(msg_type, is_tool)
-    reset = "\033[0m"
-
-    # Format type label
-    type_label = "User      " if msg_type == "user" else "Assistant "
-
     # Clean up message
     message_text = message_text.replace("\n", " ")
 
-    return f"{color}{type_label}{time_str}  {message_text}{reset}"
+    # Template carries the color and type label for this kind of message
+    return _MESSAGE_TEMPLATES[(msg_type, is_tool)] % (
+        time_str.encode(),
+        message_text.encode("utf-8", "replace"),
+    )
 
 
 def format_timestamp_as_time(timestamp):
@@ -402,35 +984,54 @@ def format_timestamp_as_time(timestamp):
     if not timestamp:
         return "00:00:00"
 
-    try:
-        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        return dt.strftime("%H:%M:%S")
-    except (ValueError, TypeError):
+    # Most timestamps have a fixed YYYY-MM-DDTHH:MM:SS prefix, so slice the
+    # time out instead of building a datetime and calling strftime
+    if (
+        _ISO_TIMESTAMP_RE.match(timestamp)
+        and timestamp[16:17] == ":"
+        and timestamp[17:19].isdigit()
+    ):
+        return timestamp[11:19]
+
+    dt = parse_timestamp(timestamp)
+    if dt is None:
         return "00:00:00"
+    return dt.strftime("%H:%M:%S")
+
+
+# Handlers for the first content item, keyed by (message type, item type)
+_CONTENT_HANDLERS = {
+    ("user", "tool_result"): lambda item: (
+        True,
+        f"Tool: {item.get('tool_use_id', 'unknown')}",
+    ),
+    ("assistant", "tool_use"): lambda item: (
+        True,
+        f"Tool: {item.get('name', 'unknown')}",
+    ),
+    ("user", "text"): lambda item: (False, item.get("text", "")),
+    ("assistant", "text"): lambda item: (False, item.get("text", "")),
+}
 
 
 def parse_message_content(msg_type, content):
     """Parse message content and determine if it's a tool message"""
+    # Decoded JSON only yields exact builtin types, so compare types directly
+    content_type = type(content)
+
     # Handle string content
-    if isinstance(content, str):
+    if content_type is str:
         return False, content
 
     # Handle list content
-    if not isinstance(content, list) or not content:
+    if content_type is not list or not content:
         return False, str(content)
 
     first_item = content[0]
-
-    # Check for tool messages
-    if msg_type == "user" and first_item.get("type") == "tool_result":
-        return True, f"Tool: {first_item.get('tool_use_id', 'unknown')}"
-
-    if msg_type == "assistant" and first_item.get("type") == "tool_use":
-        return True, f"Tool: {first_item.get('name', 'unknown')}"
-
-    # Handle text content
-    if first_item.get("type") == "text":
-        return False, first_item.get("text", "")
+    if type(first_item) is dict:
+        handler = _CONTENT_HANDLERS.get((msg_type, first_item.get("type")))
+        if handler:
+            return handler(first_item)
 
     return False, str(content)
 
@@ -445,26 +1046,59 @@ def get_message_color(msg_type, is_tool):
         return "\033[37m"  # White
 
 
+# Precomputed "<color><type label><time>  <text><reset>" line templates
+_MESSAGE_TEMPLATES = {
+    (msg_type, is_tool): (
+        get_message_color(msg_type, is_tool) + type_label + "%s  %s\033[0m"
+    ).encode()
+    for msg_type, type_label in (("user", "User      "), ("assistant", "Assistant "))
+    for is_tool in (False, True)
+}
+
+
 def view_session(file_path):
     """View session with color-coded formatting for display"""
+    # Write pre-encoded lines straight to the binary stdout in large batches
+    out = sys.stdout.buffer
+    buf = bytearray()
     try:
-        with open(file_path, "r") as f:
-            for line in f:
-                try:
-                    data = json.loads(line.strip())
-                    formatted_line = format_message_line(data)
+        with open(file_path, "rb") as f:
+            lines = iter_file_lines(f)
+            # Decode lines in batches, each line on its own so a corrupt one is skipped
+            while batch := list(islice(lines, 1000)):
+                for data in decode_json_lines(batch):
+                    if not isinstance(data, dict):
+                        # Skip malformed lines
+                        continue
+                    try:
+                        formatted_line = format_message_line(data)
+                    except (ValueError, KeyError, TypeError):
+                        continue
                     if formatted_line:
-                        print(formatted_line)
-                except (json.JSONDecodeError, KeyError, TypeError):
-                    # Skip malformed lines
-                    continue
+                        buf += formatted_line
+                        buf += b"\n"
+                        if len(buf) > 65536:
+                            out.write(buf)
+                            buf.clear()
     except Exception as e:
-        print(f"Error reading file: {e}")
+        buf += f"Error reading file: {e}\n".encode()
+    out.write(buf)
+    out.flush()
 
 
 # Cache for path lookups to avoid repeated filesystem checks
 _path_cache = {}
 
+# Decoded paths persisted across invocations, loaded lazily on first use
+_disk_path_cache = None
+_disk_path_cache_dirty = False
+
+# Cache for directory listings: path -> (mtime_ns, [(encoded name, child path)])
+_dir_cache = {}
+
+# Claude encodes "/", "." and "_" in project paths as "-"
+_PROJECT_NAME_ENCODING = str.maketrans({"/": "-", ".": "-", "_": "-"})
+
 
 def decode_project_path(encoded_name):
     """Decode project directory name back to original path"""
@@ -474,15 +1108,18 @@ def decode_project_path(encoded_name):
     # "_" -> "-"
 
     # Decoding algorithm:
-    # 1. Process encoded path from left to right
-    # 2. For each "-", first try interpreting it as "/"
-    # 3. Check if the path up to that point exists
-    # 4. If path exists, continue from there
-    # 5. If path doesn't exist or would create "//", the "-" cannot be "/"
-    # 6. Collect segments as "unmatched" and look for next "-"
-    # 7. When finding next "-", try all combinations of ".", "_", and "-" for unmatched segments
-    # 8. Continue from any matched path
-    # 9. Number of candidates grows as 3^n where n is number of unmatched "-"
+    # 1. Start at "/" with the encoded name minus its leading "-"
+    # 2. List the real child directories once and encode their names
+    # 3. A child matches if its encoded name equals the remaining input,
+    #    or is a prefix of it followed by "-" (which then stands for "/")
+    # 4. Descend into matching children, shortest name first, and
+    #    backtrack if a branch cannot consume the whole input
+    # 5. If nothing matches fully, keep the deepest matched directory and
+    #    append the remaining encoded part as-is
+    # This costs one directory listing per visited directory instead of
+    # probing every combination of "-", "." and "_" with os.path.exists
+
+    global _disk_path_cache_dirty
 
     # Check cache first
     if encoded_name in _path_cache:
@@ -493,126 +1130,102 @@ def decode_project_path(encoded_name):
         _path_cache[encoded_name] = encoded_name
         return encoded_name
 
+    # Reuse a result from a previous run while the directory still exists
+    disk_cache = load_path_cache()
+    cached = disk_cache.get(encoded_name)
+    if isinstance(cached, str) and os.path.isdir(cached):
+        _path_cache[encoded_name] = cached
+        return cached
+
     # Build path progressively
     result = decode_path_progressive(encoded_name[1:])  # Remove leading "-"
     _path_cache[encoded_name] = result
+    if os.path.isdir(result):
+        disk_cache[encoded_name] = result
+        _disk_path_cache_dirty = True
     return result
 
 
-def decode_path_progressive(encoded):
-    """Decode path by progressively building and checking segments"""
-    current_path = ""
-    unmatched_segments = []
-    i = 0
-
-    while i < len(encoded):
-        # Find next dash
-        next_dash = encoded.find("-", i)
-
-        if next_dash == -1:
-            # No more dashes, add last segment
-            segment = encoded[i:]
-            if unmatched_segments or not segment:
-                # Have unmatched segments or empty segment
-                if segment:
-                    unmatched_segments.append(segment)
-                # Try all combinations
-                result = try_segment_combinations(current_path, unmatched_segments)
-                return (
-                    result
-                    if result
-                    else current_path + "/" + "-".join(unmatched_segments)
-                )
-            else:
-                # Simple case: just append
-                return current_path + "/" + segment
-
-        # Get segment up to the dash
-        segment = encoded[i:next_dash]
-
-        # If we have unmatched segments, we need to try combinations
-        if unmatched_segments:
-            # Add this segment and try combinations
-            if segment:  # Don't add empty segments
-                unmatched_segments.append(segment)
-
-            # Try all combinations up to this point
-            result = try_segment_combinations(current_path, unmatched_segments)
-            if result:
-                # Found a match, reset and continue
-                current_path = result
-                unmatched_segments = []
-                i = next_dash + 1
-            else:
-                # No match, continue collecting segments
-                i = next_dash + 1
-        else:
-            # No unmatched segments yet
-            if segment and os.path.exists(current_path + "/" + segment):
-                # This segment matches
-                current_path = current_path + "/" + segment
-                i = next_dash + 1
-            else:
-                # This segment doesn't match, start collecting
-                if not segment:
-                    # Empty segment means we have --, which means the previous dash cannot be /
-                    # We need to look back and reinterpret
-                    # For now, just add empty segment as a marker
-                    unmatched_segments.append("")
-                else:
-                    unmatched_segments.append(segment)
-                i = next_dash + 1
+def get_path_cache_path() -> Path:
+    """Get the on-disk decoded path cache location"""
+    return get_cache_dir() / "paths.json"
 
-    return current_path
 
+def load_path_cache() -> dict:
+    """Load the decoded path cache from disk, once per process"""
+    global _disk_path_cache
+    if _disk_path_cache is None:
+        _disk_path_cache = read_json_cache(get_path_cache_path())
+    return _disk_path_cache
 
-def try_segment_combinations(base_path, segments):
-    """Try all combinations of joining segments with -, ., or _"""
-    import itertools
 
-    if not segments:
-        return None
+def save_path_cache():
+    """Write the decoded path cache back to disk atomically if it changed"""
+    global _disk_path_cache_dirty
+    if _disk_path_cache is None or not _disk_path_cache_dirty:
+        return
+    if write_json_cache(get_path_cache_path(), _disk_path_cache):
+        _disk_path_cache_dirty = False
 
-    # Handle special case where first segment is empty (from --)
-    if segments[0] == "":
-        # This means we have a leading -, which must be . or -
-        remaining_segments = segments[1:] if len(segments) > 1 else []
-
-        # Try . first (for hidden files/dirs), then _, then -
-        for prefix in [".", "_", "-"]:
-            if remaining_segments:
-                # Continue with remaining segments
-                prefixed_segments = [
-                    prefix + remaining_segments[0]
-                ] + remaining_segments[1:]
-                result = try_segment_combinations(base_path, prefixed_segments)
-                if result:
-                    return result
-            else:
-                # Just the prefix
-                test_path = os.path.join(base_path, prefix)
-                if os.path.exists(test_path):
-                    return test_path
-        return None
 
-    if len(segments) == 1:
-        # Single segment, just try it
-        test_path = os.path.join(base_path, segments[0])
-        return test_path if os.path.exists(test_path) else None
+def encode_path_segment(name):
+    """Encode a path segment the same way Claude encodes project paths"""
+    return name.translate(_PROJECT_NAME_ENCODING)
 
-    # Multiple segments, try all combinations of -, ., and _
-    # n-1 positions between n segments
-    for separators in itertools.product(["-", ".", "_"], repeat=len(segments) - 1):
-        # Build the combined segment
-        combined = segments[0]
-        for i, sep in enumerate(separators):
-            combined += sep + segments[i + 1]
 
-        test_path = os.path.join(base_path, combined)
-        if os.path.exists(test_path):
-            return test_path
+def list_encoded_children(base_path):
+    """List child directories of base_path with their encoded names"""
+    try:
+        mtime_ns = os.stat(base_path).st_mtime_ns
+    except OSError:
+        return []
 
-    return None
+    # Reuse the listing while the directory itself is unchanged
+    cached = _dir_cache.get(base_path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    children = []
+    try:
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        children.append((encode_path_segment(entry.name), entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        return []
+
+    # Prefer the shortest names so "-" is read as "/" first
+    children.sort(key=lambda child: (len(child[0]), child[1]))
+    _dir_cache[base_path] = (mtime_ns, children)
+    return children
+
+
+def decode_path_progressive(encoded):
+    """Decode path by matching encoded prefixes against real directory names"""
+    # Deepest directory reached so far and the encoded part left after it
+    best = ["/", encoded]
+
+    def walk(base_path, remaining):
+        if len(remaining) < len(best[1]):
+            best[0], best[1] = base_path, remaining
+        for encoded_child, child_path in list_encoded_children(base_path):
+            if remaining == encoded_child:
+                return child_path
+            if remaining.startswith(encoded_child + "-"):
+                result = walk(child_path, remaining[len(encoded_child) + 1 :])
+                if result:
+                    return result
+        return None
+
+    result = walk("/", encoded)
+    if result:
+        return result
+    if not best[1]:
+        return best[0]
+    return os.path.join(best[0], best[1])
 
 
 def get_project_last_activity(project_dir):
@@ -620,17 +1233,9 @@ def get_project_last_activity(project_dir):
     latest_time = 0
     session_count = 0
 
-    try:
-        for file_path in Path(project_dir).glob("*.jsonl"):
-            try:
-                stat = file_path.stat()
-                if stat.st_mtime > latest_time:
-                    latest_time = stat.st_mtime
-                session_count += 1
-            except OSError:
-                continue
-    except Exception:
-        pass
+    for _, stat in list_jsonl_files(project_dir):
+        latest_time = max(latest_time, stat.st_mtime)
+        session_count += 1
 
     return latest_time, session_count
 
@@ -660,6 +1265,8 @@ def get_projects_list():
                     }
                 )
 
+    save_path_cache()
+
     # Sort by last activity (newest first)
     projects.sort(key=lambda x: x["last_activity"], reverse=True)
 
@@ -679,7 +1286,8 @@ def get_projects_list():
         terminal_width - fixed_width - 2, 20
     )  # -2 for small margin
 
-    # Print each project
+    # Build all rows and write them in one call
+    rows = []
     for project in projects:
         last_active = format_relative_time(project["last_activity"])
         path = project["path"]
@@ -691,9 +1299,10 @@ def get_projects_list():
 
         # Use Unit Separator as delimiter
         # Send the encoded name for fzf preview to work correctly
-        print(
-            f"{last_active:<14} {project['session_count']:>8}  {path}\x1f{project['encoded_name']}"
+        rows.append(
+            f"{last_active:<14} {project['session_count']:>8}  {path}\x1f{project['encoded_name']}\n"
         )
+    sys.stdout.write("".join(rows))
 
 
 def main():
@@ -715,6 +1324,7 @@ def main():
     elif command == "decode" and len(sys.argv) >= 3:
         # Decode a project path
         print(decode_project_path(sys.argv[2]))
+        save_path_cache()
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
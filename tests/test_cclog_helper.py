@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Tests for cclog_helper.py functions"""
 
+import json
 import os
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
 import pytest
@@ -14,10 +16,45 @@ from cclog_helper import (
     extract_user_message,
     extract_timestamp,
     format_duration,
+    format_summary_truncated,
+    iter_file_lines,
+    count_lines,
+    format_timestamp_as_time,
     parse_timestamp,
+    parse_message_content,
     SessionSummary,
     build_summary_index,
+    decode_project_path,
+    decode_json_lines,
+    get_cached_session,
+    get_session_cache_path,
+    get_summary_index_cache_path,
+    get_session_info,
+    get_session_list,
+    save_path_cache,
+    save_session_cache,
+    view_session,
 )
+import cclog_helper
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path, monkeypatch):
+    """Keep on-disk caches written during tests out of the user's home"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def json_loads_calls(monkeypatch):
+    """Record every line handed to cclog_helper.json_loads"""
+    calls = []
+
+    def counting_loads(line):
+        calls.append(line)
+        return json.loads(line)
+
+    monkeypatch.setattr(cclog_helper, "json_loads", counting_loads)
+    return calls
 
 
 class TestParseSessionMinimal:
@@ -97,6 +134,117 @@ class TestParseSessionMinimal:
 
         assert summary is None
 
+    def test_long_session_without_trailing_newline(self, tmp_path):
+        """Test line count and last timestamp on a file larger than one tail chunk"""
+        conv_file = tmp_path / "long.jsonl"
+        with open(conv_file, "w") as f:
+            f.write(
+                '{"type":"user","timestamp":"2025-01-01T10:00:00Z","message":{"content":"Start"}}\n'
+            )
+            for i in range(200):
+                f.write(
+                    f'{{"type":"assistant","timestamp":"2025-01-01T10:00:05Z","message":{{"content":"{"x" * 100}"}}}}\n'
+                )
+            f.write("\n")
+            f.write('{"type":"assistant","timestamp":"2025-01-01T10:01:00Z"}')
+
+        summary = parse_session_minimal(conv_file)
+
+        assert summary is not None
+        assert summary.first_user_message == "Start"
+        assert summary.line_count == 203
+        assert summary.duration_seconds == 60
+
+    def test_nested_timestamp_is_not_start_time(self, tmp_path):
+        """Test that only top-level timestamps set the start time"""
+        conv_file = tmp_path / "conversation.jsonl"
+        with open(conv_file, "w") as f:
+            f.write(
+                '{"type":"file-history-snapshot","snapshot":{"timestamp":"2020-05-05T00:00:00.000Z"}}\n'
+            )
+            f.write(
+                '{"message":{"content":"Hi","timestamp":"2020-05-05T00:00:00.000Z"},"type":"user","timestamp":"2024-01-01T10:00:00.000Z"}\n'
+            )
+            f.write('{"type":"assistant","timestamp":"2024-01-01T10:00:30.000Z"}\n')
+
+        summary = parse_session_minimal(conv_file)
+
+        assert summary is not None
+        assert summary.start_timestamp.isoformat() == "2024-01-01T10:00:00+00:00"
+        assert summary.first_user_message == "Hi"
+        assert summary.duration_seconds == 30
+
+    def test_forward_scan_stops_early(self, tmp_path, json_loads_calls):
+        """Test that only the header and the last line are decoded without an index"""
+        conv_file = tmp_path / "conversation.jsonl"
+        with open(conv_file, "w") as f:
+            f.write(
+                '{"type":"user","timestamp":"2025-01-01T10:00:00Z","message":{"content":"Hi"}}\n'
+            )
+            for i in range(100):
+                f.write('{"type":"assistant","timestamp":"2025-01-01T10:00:05Z"}\n')
+
+        summary = parse_session_minimal(conv_file)
+
+        assert summary is not None
+        assert summary.line_count == 101
+        assert len(json_loads_calls) == 2  # First line plus the reverse-read last line
+
+
+class TestSessionTimes:
+    """Tests for the wall clock times and durations shown for sessions"""
+
+    def write_session(self, path, start, end):
+        with open(path, "w") as f:
+            f.write(
+                f'{{"type":"user","timestamp":"{start}","message":{{"content":"Hi"}}}}\n'
+            )
+            f.write(f'{{"type":"assistant","timestamp":"{end}"}}\n')
+
+    def test_offset_timestamps_keep_wall_clock(self, tmp_path):
+        """Test that timestamps with a UTC offset display in that offset"""
+        conv_file = tmp_path / "conversation.jsonl"
+        self.write_session(
+            conv_file, "2024-01-01T10:00:00+09:00", "2024-01-01T10:05:00+09:00"
+        )
+
+        summary = parse_session_minimal(conv_file)
+
+        assert summary.formatted_time == "2024-01-01 10:00:00"
+        assert summary.start_timestamp.isoformat() == "2024-01-01T10:00:00+09:00"
+        assert summary.duration_seconds == 300
+
+    def test_naive_timestamps_ignore_local_timezone(self, tmp_path, monkeypatch):
+        """Test that naive timestamps display as written under any TZ"""
+        with monkeypatch.context() as m:
+            m.setenv("TZ", "Asia/Tokyo")
+            time.tzset()
+            conv_file = tmp_path / "conversation.jsonl"
+            self.write_session(conv_file, "2024-01-01T10:00:00", "2024-01-01T10:01:00")
+
+            summary = parse_session_minimal(conv_file)
+            stat = conv_file.stat()
+            entry = cclog_helper.summary_to_cache_entry(summary, stat, "")
+            cached = cclog_helper.summary_from_cache_entry(entry, conv_file, stat)
+        time.tzset()
+
+        for parsed in (summary, cached):
+            assert parsed.formatted_time == "2024-01-01 10:00:00"
+            assert parsed.start_timestamp.isoformat() == "2024-01-01T10:00:00"
+            assert parsed.duration_seconds == 60
+
+    def test_sub_second_duration_is_not_rounded_per_end(self, tmp_path):
+        """Test that durations come from the exact difference of both ends"""
+        conv_file = tmp_path / "conversation.jsonl"
+        self.write_session(
+            conv_file, "2024-01-01T10:00:00.900Z", "2024-01-01T10:00:01.100Z"
+        )
+
+        summary = parse_session_minimal(conv_file)
+
+        assert summary.duration_seconds == 0
+        assert summary.formatted_time == "2024-01-01 10:00:00"
+
 
 class TestExtractFunctions:
     """Tests for extract_user_message and extract_timestamp functions"""
@@ -156,6 +304,22 @@ class TestExtractFunctions:
         ts = extract_timestamp(data)
         assert ts is None
 
+    def test_parse_message_content(self):
+        """Test classifying message content for the log view"""
+        tool_result = [{"type": "tool_result", "tool_use_id": "123"}]
+        tool_use = [{"type": "tool_use", "name": "Bash"}]
+        text = [{"type": "text", "text": "Hello"}]
+
+        assert parse_message_content("user", "Hi") == (False, "Hi")
+        assert parse_message_content("user", tool_result) == (True, "Tool: 123")
+        assert parse_message_content("assistant", tool_use) == (True, "Tool: Bash")
+        assert parse_message_content("assistant", text) == (False, "Hello")
+        assert parse_message_content("assistant", tool_result) == (
+            False,
+            str(tool_result),
+        )
+        assert parse_message_content("user", []) == (False, "[]")
+
 
 class TestHelperFunctions:
     """Tests for helper functions"""
@@ -171,11 +335,93 @@ class TestHelperFunctions:
         assert ts is not None
         assert ts.isoformat() == "2025-01-05T10:00:00+00:00"
 
+        # Test fractional seconds on the fast path
+        ts = parse_timestamp("2025-01-05T10:00:00.123Z")
+        assert ts is not None
+        assert ts.isoformat() == "2025-01-05T10:00:00.123000+00:00"
+
+        # Test a trailing Z outside the fast path layout
+        ts = parse_timestamp("2025-01-05 10:00:00Z")
+        assert ts is not None
+        assert ts.isoformat() == "2025-01-05T10:00:00+00:00"
+
     def test_parse_timestamp_invalid(self):
         """Test parsing invalid timestamp"""
         assert parse_timestamp("") is None
         assert parse_timestamp("not a timestamp") is None
         assert parse_timestamp(None) is None
+        assert parse_timestamp(1736071200) is None
+        assert parse_timestamp("2025-01-05") is None
+
+    def test_decode_json_lines(self):
+        """Test batch decoding with None for malformed lines"""
+        assert decode_json_lines([b'{"a":1}\n', b"\n", b'{"b":2}']) == [
+            {"a": 1},
+            {"b": 2},
+        ]
+        assert decode_json_lines([b'{"a":1}', b"not json", b"1, 2"]) == [
+            {"a": 1},
+            None,
+            None,
+        ]
+        # Malformed lines that would splice into a valid array stay malformed
+        assert decode_json_lines(
+            [b'{"type":"user","message":{"content":"trunc', b'"}}', b"1, 2"]
+        ) == [None, None, None]
+
+    def test_iter_file_lines_chunked(self, tmp_path, monkeypatch):
+        """Test that chunked reading yields the same lines as a bulk read"""
+        data = b"".join(
+            b'{"line":%d,"pad":"%s"}\n' % (i, b"x" * i) for i in range(5000)
+        )
+        path = tmp_path / "lines.jsonl"
+        path.write_bytes(data + b"last")
+
+        with open(path, "rb") as f:
+            bulk = list(iter_file_lines(f))
+        monkeypatch.setattr(cclog_helper, "_BULK_READ_LIMIT", 0)
+        with open(path, "rb") as f:
+            chunked = list(iter_file_lines(f))
+
+        assert chunked == bulk
+        assert len(bulk) == 5001
+        assert bulk[-1] == b"last"
+
+    def test_count_lines_across_chunks(self, tmp_path):
+        """Test counting lines in a file spanning several read buffers"""
+        path = tmp_path / "lines.jsonl"
+        line = b'{"pad":"%s"}\n' % (b"x" * 1000)
+        path.write_bytes(line * 3000)
+        with open(path, "rb") as f:
+            assert count_lines(f) == 3000
+
+        path.write_bytes(line * 3000 + b"last")
+        with open(path, "rb") as f:
+            assert count_lines(f) == 3001
+
+        path.write_bytes(b"")
+        with open(path, "rb") as f:
+            assert count_lines(f) == 0
+
+    def test_format_timestamp_as_time(self):
+        """Test extracting the time of day from ISO timestamps"""
+        assert format_timestamp_as_time("2025-01-05T10:20:30.000Z") == "10:20:30"
+        assert format_timestamp_as_time("2025-01-05T10:20:30+09:00") == "10:20:30"
+        assert format_timestamp_as_time("2024-01-01T10:00Z") == "10:00:00"
+        assert format_timestamp_as_time("2024-01-01 10:00:00") == "10:00:00"
+        assert format_timestamp_as_time("xxxxxxxxxxTab:cd:efgh") == "00:00:00"
+        # Only a trailing Z designates UTC
+        assert format_timestamp_as_time("2024-01-01T10Z:00") == "00:00:00"
+        assert format_timestamp_as_time("") == "00:00:00"
+        assert format_timestamp_as_time(None) == "00:00:00"
+        assert format_timestamp_as_time("not a timestamp") == "00:00:00"
+
+    def test_format_summary_truncated(self):
+        """Test escaping and truncating long messages"""
+        assert format_summary_truncated("short", 20) == "short"
+        assert format_summary_truncated("a\nb", 20) == "a\\nb"
+        assert format_summary_truncated("x" * 1000, 20) == "x" * 17 + "..."
+        assert format_summary_truncated("\n" * 1000, 20) == "\\n" * 8 + "\\..."
 
     def test_format_duration(self):
         """Test duration formatting"""
@@ -196,11 +442,17 @@ class TestSessionSummary:
         summary = SessionSummary(
             session_id="test-123",
             file_path=Path("test.jsonl"),
-            start_timestamp=datetime.fromisoformat("2025-01-05T10:00:00+00:00"),
+            start_ts=int(
+                datetime.fromisoformat("2025-01-05T10:00:00+00:00").timestamp()
+            ),
             first_user_message="Test message\nwith newline",
             modification_time=1234567890.0,
             file_size=1024,
-            last_timestamp=datetime.fromisoformat("2025-01-05T11:30:45+00:00"),
+            start_offset=0,
+            last_ts=int(
+                datetime.fromisoformat("2025-01-05T11:30:45+00:00").timestamp()
+            ),
+            last_offset=0,
             line_count=100,
         )
 
@@ -208,13 +460,17 @@ class TestSessionSummary:
         assert summary.formatted_time == "2025-01-05 10:00:00"
         assert summary.formatted_duration == "1h 30m"
         assert summary.formatted_summary == "Test message\\nwith newline"
+        assert summary.start_timestamp.isoformat() == "2025-01-05T10:00:00+00:00"
+        assert summary.last_timestamp.isoformat() == "2025-01-05T11:30:45+00:00"
 
     def test_session_summary_with_summaries(self):
         """Test SessionSummary with matched summaries"""
         summary = SessionSummary(
             session_id="test-456",
             file_path=Path("test.jsonl"),
-            start_timestamp=datetime.fromisoformat("2025-01-05T10:00:00+00:00"),
+            start_ts=int(
+                datetime.fromisoformat("2025-01-05T10:00:00+00:00").timestamp()
+            ),
             first_user_message="Test",
             modification_time=1234567890.0,
             file_size=1024,
@@ -234,7 +490,7 @@ class TestSummaryIndexing:
         index = build_summary_index(str(tmp_path))
         assert index == {}
 
-    def test_build_summary_index_no_summaries(self, tmp_path):
+    def test_build_summary_index_no_summaries(self, tmp_path, json_loads_calls):
         """Test building summary index with no summary files"""
         # Create a large conversation file (should be skipped)
         conv_file = tmp_path / "conversation.jsonl"
@@ -244,6 +500,18 @@ class TestSummaryIndexing:
 
         index = build_summary_index(str(tmp_path))
         assert index == {}
+        assert json_loads_calls == []  # Non-summary lines are never decoded
+
+    def test_build_summary_index_many_files(self, tmp_path):
+        """Test building summary index across enough files to scan in parallel"""
+        for i in range(20):
+            with open(tmp_path / f"summaries-{i}.jsonl", "w") as f:
+                f.write(
+                    f'{{"type":"summary","summary":"Topic {i}","leafUuid":"uuid-{i}"}}\n'
+                )
+
+        index = build_summary_index(str(tmp_path))
+        assert index == {f"uuid-{i}": f"Topic {i}" for i in range(20)}
 
     def test_build_summary_index_with_summaries(self, tmp_path):
         """Test building summary index with summary files"""
@@ -291,6 +559,46 @@ class TestSummaryIndexing:
         assert index["uuid-valid"] == "Valid"
         assert index["uuid-valid2"] == "Also Valid"
 
+    def test_build_summary_index_cached(self, tmp_path, monkeypatch):
+        """Test that the index is reused until a candidate file changes"""
+        summary_file = tmp_path / "summaries.jsonl"
+        summary_file.write_text(
+            '{"type":"summary","summary":"Topic 1","leafUuid":"uuid-1"}\n'
+        )
+        assert build_summary_index(str(tmp_path)) == {"uuid-1": "Topic 1"}
+
+        scanned = []
+        scan = cclog_helper.scan_summary_files
+        monkeypatch.setattr(
+            cclog_helper,
+            "scan_summary_files",
+            lambda candidates: scanned.append(candidates) or scan(candidates),
+        )
+        assert build_summary_index(str(tmp_path)) == {"uuid-1": "Topic 1"}
+        assert scanned == []
+
+        with open(summary_file, "a") as f:
+            f.write('{"type":"summary","summary":"Topic 2","leafUuid":"uuid-2"}\n')
+        index = build_summary_index(str(tmp_path))
+        assert index == {"uuid-1": "Topic 1", "uuid-2": "Topic 2"}
+        assert len(scanned) == 1
+
+    def test_build_summary_index_cache_per_project(self, tmp_path):
+        """Test that each project caches its own index and missing ones none"""
+        for name in ("project-a", "project-b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "summaries.jsonl").write_text(
+                f'{{"type":"summary","summary":"{name}","leafUuid":"uuid-1"}}\n'
+            )
+            build_summary_index(str(tmp_path / name))
+
+        for name in ("project-a", "project-b"):
+            with open(get_summary_index_cache_path(tmp_path / name)) as f:
+                assert json.load(f)["index"] == {"uuid-1": name}
+
+        assert build_summary_index(str(tmp_path / "missing")) == {}
+        assert not get_summary_index_cache_path(tmp_path / "missing").exists()
+
     def test_parse_session_with_summaries(self, tmp_path):
         """Test parsing session with summary matching"""
         # Create summary file
@@ -373,6 +681,32 @@ class TestSummaryIndexing:
             "Duplicate Topic"
         ]  # Should only appear once
 
+    def test_parse_session_prefilter_skips_lines(self, tmp_path, json_loads_calls):
+        """Test that only indexed assistant lines are decoded after the header"""
+        conv_file = tmp_path / "conversation.jsonl"
+        with open(conv_file, "w") as f:
+            f.write(
+                '{"type":"user","timestamp":"2025-01-01T10:00:00Z","message":{"content":"Hi"}}\n'
+            )
+            for i in range(30):
+                f.write('{"type":"system","timestamp":"2025-01-01T10:00:01Z"}\n')
+            f.write('{"type":"assistant","timestamp":"2025-01-01T10:00:02Z"}\n')
+            f.write(
+                '{"type":"assistant","uuid":"asst-other","timestamp":"2025-01-01T10:00:03Z"}\n'
+            )
+            f.write(
+                '{"type":"assistant","uuid":"asst-123","timestamp":"2025-01-01T10:00:05Z"}\n'
+            )
+
+        summary = parse_session_minimal(conv_file, {"asst-123": "Topic"})
+
+        assert summary is not None
+        assert summary.matched_summaries == ["Topic"]
+        assert summary.line_count == 34
+        assert (
+            len(json_loads_calls) == 3
+        )  # Header, indexed assistant line and the last line
+
     def test_summary_file_size_limit(self, tmp_path):
         """Test that large files are skipped when building index"""
         # Create a large file (>10KB)
@@ -398,5 +732,200 @@ class TestSummaryIndexing:
         assert "uuid-0" not in index  # From large file
 
 
+class TestViewSession:
+    """Tests for view_session output"""
+
+    def test_view_session_output(self, capsysbinary):
+        """Test that formatted lines are written as UTF-8 bytes"""
+        view_session("tests/fixtures/array_content_format.jsonl")
+        lines = capsysbinary.readouterr().out.splitlines()
+
+        assert len(lines) == 4
+        assert lines[0] == (
+            b"\033[36mUser      12:00:00  Explain async/await in JavaScript\033[0m"
+        )
+        assert lines[2] == b"\033[38;5;244mAssistant 12:00:20  Tool: Bash\033[0m"
+
+
+class TestSessionCache:
+    """Tests for the on-disk session summary cache"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path, monkeypatch):
+        """Reset the in-process cache state"""
+        monkeypatch.setattr(cclog_helper, "_session_caches", {})
+        monkeypatch.setattr(cclog_helper, "_dirty_session_caches", {})
+        monkeypatch.setattr(cclog_helper, "_disk_path_cache", None)
+        monkeypatch.setattr(cclog_helper, "_disk_path_cache_dirty", False)
+        monkeypatch.setattr(cclog_helper, "_path_cache", {})
+
+    def write_session(self, path, message):
+        with open(path, "w") as f:
+            f.write(
+                f'{{"type":"user","timestamp":"2025-01-01T10:00:00Z","message":{{"content":"{message}"}}}}\n'
+            )
+            f.write(
+                '{"type":"assistant","uuid":"asst-1","timestamp":"2025-01-01T10:00:30Z"}\n'
+            )
+
+    def test_cache_roundtrip(self, tmp_path, monkeypatch):
+        """Test that unchanged files are served from the cache without parsing"""
+        conv_file = tmp_path / "conversation.jsonl"
+        self.write_session(conv_file, "Cached")
+
+        summary = get_cached_session(conv_file, conv_file.stat())
+        save_session_cache()
+        assert get_session_cache_path(tmp_path).exists()
+
+        # Reload from disk and make sure the file is not parsed again
+        monkeypatch.setattr(cclog_helper, "_session_caches", {})
+        monkeypatch.setattr(cclog_helper, "parse_session_minimal", None)
+        cached = get_cached_session(conv_file, conv_file.stat())
+
+        assert cached == summary
+        assert cached.first_user_message == "Cached"
+        assert cached.duration_seconds == 30
+
+    def test_cache_invalidated_on_change(self, tmp_path):
+        """Test that modified files and summary indexes are reparsed"""
+        conv_file = tmp_path / "conversation.jsonl"
+        self.write_session(conv_file, "Before")
+        get_cached_session(conv_file, conv_file.stat())
+
+        self.write_session(conv_file, "After change")
+        summary = get_cached_session(conv_file, conv_file.stat())
+        assert summary.first_user_message == "After change"
+
+        summary = get_cached_session(conv_file, conv_file.stat(), {"asst-1": "Topic"})
+        assert summary.matched_summaries == ["Topic"]
+
+    def test_line_count_filled_lazily(self, tmp_path):
+        """Test that cached entries without a line count are reparsed on demand"""
+        conv_file = tmp_path / "conversation.jsonl"
+        self.write_session(conv_file, "Lazy")
+
+        summary = get_cached_session(conv_file, conv_file.stat(), with_line_count=False)
+        assert summary.line_count is None
+
+        summary = get_cached_session(conv_file, conv_file.stat())
+        assert summary.line_count == 2
+
+        summary = get_cached_session(conv_file, conv_file.stat(), with_line_count=False)
+        assert summary.line_count == 2
+
+    def test_line_count_filled_without_reparse(self, tmp_path, monkeypatch):
+        """Test that a preview only counts lines of a session the list cached"""
+        conv_file = tmp_path / "conversation.jsonl"
+        self.write_session(conv_file, "Count me")
+        get_cached_session(conv_file, conv_file.stat(), with_line_count=False)
+
+        monkeypatch.setattr(cclog_helper, "parse_session_minimal", None)
+        summary = get_cached_session(conv_file, conv_file.stat())
+        assert summary.line_count == 2
+
+    def test_concurrent_saves_merge(self, tmp_path, monkeypatch):
+        """Test that saving keeps entries another process wrote meanwhile"""
+        for name in ("first", "second"):
+            self.write_session(tmp_path / f"{name}.jsonl", name)
+
+        # Each run loads the cache before the other one saves
+        conv_file = tmp_path / "first.jsonl"
+        get_cached_session(conv_file, conv_file.stat())
+        first_run = (cclog_helper._session_caches, cclog_helper._dirty_session_caches)
+        monkeypatch.setattr(cclog_helper, "_session_caches", {})
+        monkeypatch.setattr(cclog_helper, "_dirty_session_caches", {})
+        conv_file = tmp_path / "second.jsonl"
+        get_cached_session(conv_file, conv_file.stat())
+        save_session_cache()
+
+        monkeypatch.setattr(cclog_helper, "_session_caches", first_run[0])
+        monkeypatch.setattr(cclog_helper, "_dirty_session_caches", first_run[1])
+        save_session_cache()
+
+        with open(get_session_cache_path(tmp_path)) as f:
+            assert sorted(json.load(f)) == ["first.jsonl", "second.jsonl"]
+
+    def test_cached_message_truncated(self, tmp_path, monkeypatch):
+        """Test that only the displayed start of long messages is cached"""
+        conv_file = tmp_path / "conversation.jsonl"
+        self.write_session(conv_file, "x" * 100000)
+        get_cached_session(conv_file, conv_file.stat())
+        save_session_cache()
+
+        monkeypatch.setattr(cclog_helper, "_session_caches", {})
+        cached = get_cached_session(conv_file, conv_file.stat())
+        assert len(cached.first_user_message) == cclog_helper._CACHED_MESSAGE_CHARS
+        assert format_summary_truncated(cached.first_user_message, 200) == (
+            format_summary_truncated("x" * 100000, 200)
+        )
+
+    def test_cache_sharded_per_project(self, tmp_path):
+        """Test that each project directory gets its own cache file"""
+        for name in ("project-a", "project-b"):
+            (tmp_path / name).mkdir()
+            conv_file = tmp_path / name / f"{name}.jsonl"
+            self.write_session(conv_file, name)
+            get_cached_session(conv_file, conv_file.stat())
+        save_session_cache()
+
+        for name in ("project-a", "project-b"):
+            with open(get_session_cache_path(tmp_path / name)) as f:
+                assert list(json.load(f)) == [f"{name}.jsonl"]
+
+    def test_list_prunes_deleted_sessions(self, tmp_path, monkeypatch, capsys):
+        """Test that listing a project drops cache entries of removed files"""
+        project = tmp_path / "project"
+        project.mkdir()
+        for name in ("kept", "deleted"):
+            self.write_session(project / f"{name}.jsonl", name)
+        get_session_list(project)
+
+        (project / "deleted.jsonl").unlink()
+        monkeypatch.setattr(cclog_helper, "_session_caches", {})
+        get_session_list(project)
+        capsys.readouterr()
+
+        with open(get_session_cache_path(project)) as f:
+            assert list(json.load(f)) == ["kept.jsonl"]
+
+    def test_info_uses_cache(self, tmp_path, monkeypatch, capsys):
+        """Test that the info view resolves sessions from the cache"""
+        conv_file = tmp_path / "conversation.jsonl"
+        self.write_session(conv_file, "From cache")
+        get_cached_session(conv_file, conv_file.stat())
+
+        monkeypatch.setattr(cclog_helper, "parse_session_minimal", None)
+        get_session_info(str(conv_file))
+
+        out = capsys.readouterr().out
+        assert "Session:   conversation" in out
+        assert "Duration:  30s" in out
+
+    def test_info_with_prebuilt_summary_index(self, tmp_path, monkeypatch, capsys):
+        """Test that a passed-in summary index is used instead of rebuilding it"""
+        conv_file = tmp_path / "conversation.jsonl"
+        self.write_session(conv_file, "Prebuilt index")
+
+        monkeypatch.setattr(cclog_helper, "build_summary_index", None)
+        get_session_info(str(conv_file), summary_index={})
+
+        assert "Session:   conversation" in capsys.readouterr().out
+
+    def test_decoded_path_cache(self, tmp_path, monkeypatch):
+        """Test that decoded project paths persist across runs while they exist"""
+        project = tmp_path / "my_project"
+        project.mkdir()
+        encoded = str(project).replace("/", "-").replace(".", "-").replace("_", "-")
+
+        assert decode_project_path(encoded) == str(project)
+        save_path_cache()
+
+        # A new run resolves from disk without walking the filesystem
+        monkeypatch.setattr(cclog_helper, "_path_cache", {})
+        monkeypatch.setattr(cclog_helper, "_disk_path_cache", None)
+        monkeypatch.setattr(cclog_helper, "decode_path_progressive", None)
+        assert decode_project_path(encoded) == str(project)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,21 +4,72 @@
 import os
 import sys
 import tempfile
-import shutil
+
+import pytest
 
 # Add parent directory to path to import cclog_helper
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import cclog_helper
 from cclog_helper import decode_project_path
 
+# Claude encodes "/", "." and "_" in project paths as "-"; test paths
+# are ASCII, so the byte-level translate applies
+_ENCODE_TABLE = bytes.maketrans(b"/._", b"---")
+
+# Paths under the test tree that must decode back to themselves
+ROUNDTRIP_PATHS = [
+    # Simple paths without special characters
+    "/home/user/projects/myapp",
+    "/home/user/documents",
+    "/home/user/workspace/project1",
+    "/home/user/workspace/blog",
+    # Dots encoded as dashes (also guards against double slashes)
+    "/home/user/.config",
+    "/home/user/.config/app",
+    "/home/user/projects/plugin.nvim",
+    # Git worktrees with complex encoding
+    "/home/user/projects/myapp/.git/worktrees/workspace-feat-new-feature-1751800909-a0c4a922/worktree",
+    "/home/user/projects/data-analytics/.git/worktrees/workspace-refactor-module-1750951165-4b5956ae/worktree",
+    "/home/user/projects/data-analytics/.git/worktrees/workspace-add-tests-1750399353-9b977c1c/worktree",
+    # Dashes in project names
+    "/home/user/projects/data-analytics",
+    # Underscores encoded as dashes
+    "/home/user/my_project",
+    "/home/user/workspace/test_app",
+    "/home/user/my_awesome_project",
+    # Worktree that decodes without a /worktree suffix
+    "/home/user/projects/myapp/.git/worktrees/workspace-cleanup-task-1751180835-1ea678d3",
+]
+
+
+def _encode(path):
+    """Encode an absolute path in the same way Claude encodes it"""
+    return path.encode("ascii").translate(_ENCODE_TABLE).decode("ascii")
+
+
+def _remove_tree(root):
+    """Remove a tree of plain files and directories bottom-up"""
+    # os.walk classifies entries from scandir's d_type, so unlike
+    # shutil.rmtree no extra lstat is spent per entry
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        for name in filenames:
+            os.unlink(os.path.join(dirpath, name))
+        for name in dirnames:
+            os.rmdir(os.path.join(dirpath, name))
+    os.rmdir(root)
+
 
 class TestDecodeProjectPath:
     """Test decode_project_path function with various encoded paths"""
 
-    def setup_method(self):
-        """Create a temporary directory structure for testing"""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.test_dir)
+    @classmethod
+    def setup_class(cls):
+        """Create the temporary directory structure shared by all tests"""
+        # Keep the tree in RAM where a writable tmpfs is available
+        shm = "/dev/shm"
+        root = shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else None
+        cls.test_dir = tempfile.mkdtemp(dir=root)
+        cls.test_dir_slash = cls.test_dir + "/"
 
         # Create test directory structure
         dirs_to_create = [
@@ -39,91 +90,63 @@ class TestDecodeProjectPath:
             "home/user/projects/myapp/.git/worktrees/workspace-cleanup-task-1751180835-1ea678d3",
         ]
 
-        for dir_path in dirs_to_create:
-            os.makedirs(os.path.join(self.test_dir, dir_path), exist_ok=True)
-
-    def teardown_method(self):
+        # Expand every entry into its ancestors and create each directory
+        # once, parents first, with a plain mkdir (no makedirs pre-stats)
+        all_dirs = {
+            "/".join(parts[:depth])
+            for parts in (dir_path.split("/") for dir_path in dirs_to_create)
+            for depth in range(1, len(parts) + 1)
+        }
+        for dir_path in sorted(all_dirs, key=lambda d: d.count("/")):
+            os.mkdir(f"{cls.test_dir}/{dir_path}")
+
+        # The round-trip inputs and results only depend on test_dir, so
+        # build them once
+        cls.encoded_paths = {path: cls.encode_path(path) for path in ROUNDTRIP_PATHS}
+        cls.expected_paths = {path: cls.test_dir + path for path in ROUNDTRIP_PATHS}
+
+    @classmethod
+    def teardown_class(cls):
         """Clean up temporary directory"""
-        os.chdir(self.original_cwd)
-        shutil.rmtree(self.test_dir)
-
-    def encode_path(self, path):
+        _remove_tree(cls.test_dir)
+
+    @pytest.fixture(autouse=True)
+    def fresh_decode_caches(self, monkeypatch):
+        """Start every test with fresh decode caches and leave none behind"""
+        # Every test exercises the decoder and never sees paths.json from
+        # the user's cache directory. Decoding walks absolute paths from
+        # "/", so the working directory is left alone.
+        monkeypatch.setattr(cclog_helper, "_path_cache", {})
+        monkeypatch.setattr(cclog_helper, "_dir_cache", {})
+        monkeypatch.setattr(cclog_helper, "_disk_path_cache", {})
+        monkeypatch.setattr(cclog_helper, "_disk_path_cache_dirty", False)
+        yield
+        cclog_helper._path_cache.clear()
+        cclog_helper._dir_cache.clear()
+
+    @classmethod
+    def encode_path(cls, path):
         """Encode a path in the same way Claude encodes it"""
-        # Remove test_dir prefix to get relative path
-        if path.startswith(self.test_dir + "/"):
-            path = path[len(self.test_dir) :]
-        elif path.startswith(self.test_dir):
-            path = path[len(self.test_dir) :]
+        # Remove test_dir prefix to get relative path (both "<test_dir>/..."
+        # and a bare "<test_dir>..." keep whatever follows the prefix)
+        path = path.removeprefix(cls.test_dir)
 
         # Add test_dir as prefix and encode
         full_path = (
-            self.test_dir + path if path.startswith("/") else self.test_dir + "/" + path
+            cls.test_dir + path if path.startswith("/") else cls.test_dir_slash + path
+        )
+        return _encode(full_path)
+
+    @pytest.mark.parametrize("path", ROUNDTRIP_PATHS)
+    def test_roundtrip(self, path):
+        """Test that encoded paths decode back to the existing directory"""
+        expected = self.expected_paths[path]
+        encoded = self.encoded_paths[path]
+        result = decode_project_path(encoded)
+        assert "//" not in result, f"Result should not contain double slashes: {result}"
+        assert result == expected, (
+            f"Failed for {encoded}: got {result}, expected {expected}"
         )
-        encoded = full_path.replace("/", "-").replace(".", "-").replace("_", "-")
-        return encoded
-
-    def test_simple_paths(self):
-        """Test simple paths without special characters"""
-        paths = [
-            "/home/user/projects/myapp",
-            "/home/user/documents",
-            "/home/user/workspace/project1",
-            "/home/user/workspace/blog",
-        ]
-
-        for path in paths:
-            expected = f"{self.test_dir}{path}"
-            encoded = self.encode_path(path)
-            result = decode_project_path(encoded)
-            assert result == expected, (
-                f"Failed for {encoded}: got {result}, expected {expected}"
-            )
-
-    def test_paths_with_dots(self):
-        """Test paths containing dots that get encoded as dashes"""
-        paths = [
-            "/home/user/.config",
-            "/home/user/.config/app",
-            "/home/user/projects/plugin.nvim",
-        ]
-
-        for path in paths:
-            expected = f"{self.test_dir}{path}"
-            encoded = self.encode_path(path)
-            result = decode_project_path(encoded)
-            assert result == expected, (
-                f"Failed for {encoded}: got {result}, expected {expected}"
-            )
-
-    def test_git_worktrees(self):
-        """Test git worktree paths with complex encoding"""
-        paths = [
-            "/home/user/projects/myapp/.git/worktrees/workspace-feat-new-feature-1751800909-a0c4a922/worktree",
-            "/home/user/projects/data-analytics/.git/worktrees/workspace-refactor-module-1750951165-4b5956ae/worktree",
-            "/home/user/projects/data-analytics/.git/worktrees/workspace-add-tests-1750399353-9b977c1c/worktree",
-        ]
-
-        for path in paths:
-            expected = f"{self.test_dir}{path}"
-            encoded = self.encode_path(path)
-            result = decode_project_path(encoded)
-            assert result == expected, (
-                f"Failed for {encoded}: got {result}, expected {expected}"
-            )
-
-    def test_paths_with_dashes(self):
-        """Test paths containing dashes in project names"""
-        paths = [
-            "/home/user/projects/data-analytics",
-        ]
-
-        for path in paths:
-            expected = f"{self.test_dir}{path}"
-            encoded = self.encode_path(path)
-            result = decode_project_path(encoded)
-            assert result == expected, (
-                f"Failed for {encoded}: got {result}, expected {expected}"
-            )
 
     def test_edge_cases(self):
         """Test edge cases and potential error conditions"""
@@ -141,78 +164,37 @@ class TestDecodeProjectPath:
             # For these edge cases, just ensure no exception is raised
             assert isinstance(result, str), f"Should return string for {encoded}"
 
-    def test_actual_failures(self):
-        """Test cases that were reported as failures"""
-        # Test double slash prevention
-        paths = [
-            "/home/user/.config",
-            "/home/user/.config/app",
-        ]
-
-        for path in paths:
-            expected = f"{self.test_dir}{path}"
-            encoded = self.encode_path(path)
-            result = decode_project_path(encoded)
-            assert "//" not in result, (
-                f"Result should not contain double slashes: {result}"
-            )
-            assert result == expected, (
-                f"Failed for {encoded}: got {result}, expected {expected}"
-            )
+    def test_mixed_separators(self, tmp_path):
+        """Test names mixing dashes, dots and underscores in one segment"""
+        # Built in its own tree so the shared one stays the same for every test
+        expected = f"{tmp_path}/home/user/my_app-v1.2/sub_dir.d"
+        os.makedirs(expected)
 
-    def test_paths_with_underscores(self):
-        """Test paths containing underscores that get encoded as dashes"""
-        paths = [
-            "/home/user/my_project",
-            "/home/user/workspace/test_app",
-            "/home/user/my_awesome_project",
-        ]
-
-        for path in paths:
-            expected = f"{self.test_dir}{path}"
-            encoded = self.encode_path(path)
-            result = decode_project_path(encoded)
-            assert result == expected, (
-                f"Failed for {encoded}: got {result}, expected {expected}"
-            )
-
-    def test_worktree_without_suffix(self):
-        """Test worktree paths that should decode without /worktree suffix"""
-        paths = [
-            "/home/user/projects/myapp/.git/worktrees/workspace-cleanup-task-1751180835-1ea678d3",
-        ]
-
-        for path in paths:
-            expected = f"{self.test_dir}{path}"
-            encoded = self.encode_path(path)
-            result = decode_project_path(encoded)
-            assert "//" not in result, (
-                f"Result should not contain double slashes: {result}"
-            )
-            assert result == expected, (
-                f"Failed for {encoded}: got {result}, expected {expected}"
-            )
+        encoded = _encode(expected)
+        result = decode_project_path(encoded)
+        assert result == expected, (
+            f"Failed for {encoded}: got {result}, expected {expected}"
+        )
 
-    def test_ambiguous_decode(self):
+    def test_ambiguous_decode(self, tmp_path):
         """Test that ambiguous cases are resolved by filesystem checks"""
         # This test demonstrates that when multiple interpretations exist,
         # the decoder will return the first match found
 
-        # Create both possible interpretations
-        os.makedirs(os.path.join(self.test_dir, "home/user/test-app"), exist_ok=True)
-        os.makedirs(os.path.join(self.test_dir, "home/user/test/app"), exist_ok=True)
+        # Create both possible interpretations in a tree of its own
+        os.makedirs(f"{tmp_path}/home/user/test-app")
+        os.makedirs(f"{tmp_path}/home/user/test/app")
 
         # Encode test-app (dash in name)
-        path1 = "/home/user/test-app"
-        encoded1 = self.encode_path(path1)
+        encoded1 = _encode(f"{tmp_path}/home/user/test-app")
 
         # The decoder will match one of the existing paths
         result1 = decode_project_path(encoded1)
 
         # Just verify it matches one of the valid paths
         valid_paths = [
-            f"{self.test_dir}/home/user/test-app",
-            f"{self.test_dir}/home/user/test/app",
+            f"{tmp_path}/home/user/test-app",
+            f"{tmp_path}/home/user/test/app",
         ]
         assert result1 in valid_paths, (
             f"Result should be one of the valid paths: {result1}"
@@ -220,48 +202,4 @@ class TestDecodeProjectPath:
 
 
 if __name__ == "__main__":
-    # Run tests
-    test = TestDecodeProjectPath()
-
-    print("Running tests with temporary directory structure...")
-    test.setup_method()
-    try:
-        print("\nRunning simple path tests...")
-        test.test_simple_paths()
-        print("✓ Simple path tests passed")
-
-        print("\nRunning paths with dots tests...")
-        test.test_paths_with_dots()
-        print("✓ Paths with dots tests passed")
-
-        print("\nRunning git worktrees tests...")
-        test.test_git_worktrees()
-        print("✓ Git worktrees tests passed")
-
-        print("\nRunning paths with dashes tests...")
-        test.test_paths_with_dashes()
-        print("✓ Paths with dashes tests passed")
-
-        print("\nRunning edge case tests...")
-        test.test_edge_cases()
-        print("✓ Edge case tests passed")
-
-        print("\nRunning actual failure tests...")
-        test.test_actual_failures()
-        print("✓ Actual failure tests passed")
-
-        print("\nRunning paths with underscores tests...")
-        test.test_paths_with_underscores()
-        print("✓ Paths with underscores tests passed")
-
-        print("\nRunning worktree without suffix tests...")
-        test.test_worktree_without_suffix()
-        print("✓ Worktree without suffix tests passed")
-
-        print("\nRunning ambiguous decode tests...")
-        test.test_ambiguous_decode()
-        print("✓ Ambiguous decode tests passed")
-
-        print("\n✅ All tests passed!")
-    finally:
-        test.teardown_method()
+    pytest.main([__file__, "-v"])